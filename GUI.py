@@ -2,12 +2,15 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from password_tests import PasswordAnalyzer
 from translations import TRANSLATIONS, FLAGS
+from bulk_audit_gui import BulkAuditWindow
 
 class PasswordTester:
     def __init__(self, root):
         self.root = root
         self.analyzer = PasswordAnalyzer()
         self.current_language = 'en'
+        self.bulk_audit_window = None
+        self.last_analysis = None
         self.setup_window()
         self.setup_styles()
         self.create_widgets()
@@ -21,8 +24,14 @@ class PasswordTester:
         self.current_language = lang
         self.analyzer.set_language(lang)
         self.update_interface_language()
-        if self.password_var.get():
-            self.analyze_password(self.password_var.get())
+        password = self.password_var.get()
+        if password and self.last_analysis and self.last_analysis['password'] == password:
+            analysis = self.analyzer.localize_analysis(self.last_analysis['shared'], lang)
+            self.last_analysis = analysis
+            self.display_results(analysis)
+            self.update_metrics_panel(analysis)
+        elif password:
+            self.analyze_password(password)
         
     def setup_window(self):
         self.root.title("CyberSec Password Strength Analyzer")
@@ -100,6 +109,11 @@ class PasswordTester:
         self.status_label = tk.Label(status_content, text=self.get_text('system_active'), 
                                font=("Segoe UI", 9, "bold"), fg="#00ff88", bg="#1a1a1a")
         self.status_label.pack(side="left", pady=5)
+        self.bulk_audit_btn = tk.Button(right_section, text=self.get_text('bulk_audit'),
+                                  font=("Segoe UI", 9, "bold"), fg="#00ff88", bg="#2d2d2d",
+                                  relief="flat", bd=0, cursor="hand2", padx=10, pady=4,
+                                  command=self.open_bulk_audit)
+        self.bulk_audit_btn.pack(anchor="n", pady=(10, 0))
         content_frame = tk.Frame(main_container, bg="#0f0f0f")
         content_frame.pack(fill="both", expand=True, padx=40, pady=30)
         left_panel = tk.Frame(content_frame, bg="#0f0f0f")
@@ -247,11 +261,21 @@ class PasswordTester:
         self.results_title_label.config(text=self.get_text('security_analysis'))
         self.results_desc_label.config(text=self.get_text('security_analysis_desc'))
         self.metrics_title_label.config(text=self.get_text('security_metrics'))
+        self.bulk_audit_btn.config(text=self.get_text('bulk_audit'))
+        if self.bulk_audit_window:
+            self.bulk_audit_window.update_interface_language()
         for lang in FLAGS.keys():
             btn = getattr(self, f"lang_btn_{lang}")
             btn.config(bg="#2d2d2d" if lang == self.current_language else "#1a1a1a")
         self.update_metrics_panel(None)
     
+    def open_bulk_audit(self):
+        """Open the bulk audit window, or focus it if already open"""
+        if self.bulk_audit_window:
+            self.bulk_audit_window.window.lift()
+            return
+        self.bulk_audit_window = BulkAuditWindow(self.root, self)
+
     def clear_password(self):
         self.password_var.set("")
         self.clear_results()
@@ -280,6 +304,7 @@ class PasswordTester:
         if not password:
             return 
         analysis = self.analyzer.perform_security_tests(password)
+        self.last_analysis = analysis
         self.display_results(analysis)
         self.update_metrics_panel(analysis)
         
@@ -0,0 +1,158 @@
+import marshal
+import mmap
+import os
+import re
+import struct
+import sys
+from keyboard_layouts import DIRECTIONS, KEYBOARD_LAYOUTS, WALK_TABLE_VERSION, default_walk_table
+from password_tests import PasswordAnalyzer
+from wordlists import (DEFAULT_DICTIONARY_WORDS, DEFAULT_COMMON_PATTERNS, DEFAULT_COMMON_NAMES,
+                       Wordlists, load_wordlists, patterns_source, wordlist_signature, words_source)
+
+SNAPSHOT_MAGIC = b'PWASNAP\x00'
+SNAPSHOT_VERSION = 2
+HEADER = struct.Struct('<8sHHI')
+SECTION = struct.Struct('<4sII')
+
+def source_key(wordlist_dir, signature):
+    """Describe everything a snapshot is built from, so any change forces a rebuild.
+
+    The Python version is included because marshal data is only readable by
+    the version that wrote it.
+    """
+    sources = (sys.version_info[:2], WALK_TABLE_VERSION, KEYBOARD_LAYOUTS, DIRECTIONS, DEFAULT_DICTIONARY_WORDS,
+               DEFAULT_COMMON_PATTERNS, DEFAULT_COMMON_NAMES,
+               os.path.abspath(wordlist_dir) if wordlist_dir else None, signature)
+    return repr(sources).encode('utf-8')
+
+def pack_wordlists(wordlists):
+    """Serialize {list name: (matcher source, words)} for every list"""
+    records = {f'dictionary_{lang}': (words_source(words), words) for lang, words in wordlists.dictionary_words.items()}
+    records['common_patterns'] = (patterns_source(wordlists.common_patterns), wordlists.common_patterns)
+    records['common_names'] = (words_source(wordlists.common_names), wordlists.common_names)
+    return marshal.dumps(records)
+
+def write_snapshot(path, wordlist_dir=None):
+    """Build the analyzer data from its sources and atomically write a snapshot to path"""
+    wordlists = load_wordlists(wordlist_dir)
+    sections = [
+        (b'SRCS', source_key(wordlist_dir, wordlists.signature)),
+        (b'WALK', marshal.dumps(default_walk_table())),
+        (b'WORD', pack_wordlists(wordlists))
+    ]
+    offset = HEADER.size + SECTION.size * len(sections)
+    parts = [HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, 0, len(sections))]
+    for tag, data in sections:
+        parts.append(SECTION.pack(tag, offset, len(data)))
+        offset += len(data)
+    parts.extend(data for tag, data in sections)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(b''.join(parts))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+class LazyMatcher:
+    """Regex matcher that compiles its source on the first search.
+
+    Compiling the word list alternations is most of the analyzer's setup cost,
+    so a snapshot defers it until a password is actually tested.
+    """
+
+    def __init__(self, source):
+        self.source = source
+        self.pattern = None
+
+    def search(self, text):
+        if self.pattern is None:
+            self.pattern = re.compile(self.source)
+        return self.pattern.search(text)
+
+def lazy_matcher(source):
+    return LazyMatcher(source) if source else None
+
+class AnalyzerSnapshot:
+    """Memory-mapped analyzer snapshot written by write_snapshot.
+
+    Sections are decoded straight from the mapping with marshal; close() it
+    once the walk table and word lists have been taken out.
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.data) < HEADER.size:
+            self.close()
+            raise ValueError(f'Truncated analyzer snapshot: {path}')
+        magic, version, _, count = HEADER.unpack_from(self.data, 0)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            self.close()
+            raise ValueError(f'Unsupported analyzer snapshot: {path}')
+        self.sections = {}
+        for index in range(count):
+            tag, offset, length = SECTION.unpack_from(self.data, HEADER.size + index * SECTION.size)
+            self.sections[tag] = (offset, length)
+
+    def close(self):
+        self.data.close()
+
+    def section(self, tag):
+        offset, length = self.sections[tag]
+        with memoryview(self.data) as view:
+            return marshal.loads(view[offset:offset + length])
+
+    def matches_sources(self, key):
+        """Return True if the snapshot was built from the sources described by key"""
+        offset, length = self.sections.get(b'SRCS', (0, 0))
+        return length == len(key) and self.data[offset:offset + length] == key
+
+    def walk_table(self):
+        return self.section(b'WALK')
+
+    def wordlists(self, signature=()):
+        """Rebuild the Wordlists, with matchers compiled lazily from their stored sources"""
+        records = self.section(b'WORD')
+        dictionary_words = {}
+        dictionary_matchers = {}
+        for name, (source, words) in records.items():
+            if name.startswith('dictionary_'):
+                lang = name[len('dictionary_'):]
+                dictionary_words[lang] = words
+                dictionary_matchers[lang] = lazy_matcher(source)
+        return Wordlists(
+            dictionary_words=dictionary_words,
+            common_patterns=records['common_patterns'][1],
+            common_names=records['common_names'][1],
+            dictionary_matchers=dictionary_matchers,
+            pattern_matcher=lazy_matcher(records['common_patterns'][0]),
+            name_matcher=lazy_matcher(records['common_names'][0]),
+            signature=signature
+        )
+
+def load_analyzer(path, wordlist_dir=None):
+    """Return a PasswordAnalyzer backed by the snapshot at path.
+
+    The snapshot is rebuilt first if it is missing, unreadable or was built
+    from different word lists, layouts, walk table logic or snapshot version.
+    If it cannot be written, the analyzer is built from source as usual.
+    """
+    signature = wordlist_signature(wordlist_dir)
+    key = source_key(wordlist_dir, signature)
+    try:
+        snapshot = AnalyzerSnapshot(path)
+    except (OSError, ValueError):
+        snapshot = None
+    if snapshot is not None and not snapshot.matches_sources(key):
+        snapshot.close()
+        snapshot = None
+    if snapshot is None:
+        try:
+            write_snapshot(path, wordlist_dir)
+            snapshot = AnalyzerSnapshot(path)
+        except (OSError, ValueError):
+            return PasswordAnalyzer(wordlist_dir)
+    try:
+        return PasswordAnalyzer(wordlist_dir, wordlists=snapshot.wordlists(signature), walk_table=snapshot.walk_table())
+    finally:
+        snapshot.close()
@@ -0,0 +1,216 @@
+import time
+STARTED = time.perf_counter()
+
+import argparse
+import json
+import os
+import sys
+import zlib
+from analyzer_snapshot import load_analyzer
+from markov_model import MarkovModel
+from password_tests import PasswordAnalyzer, LANGUAGES
+
+OK_STATUSES = ('PASS', 'EXCELLENT', 'GOOD')
+CHECKPOINT_VERSION = 2
+
+def make_record(analyzer, line_no, analysis):
+    """Build the flat result record written for one audited password"""
+    level, _ = analyzer.get_security_level(analysis['total_score'])
+    return {
+        'line': line_no,
+        'password': analysis['password'],
+        'total_score': analysis['total_score'],
+        'security_level': level,
+        'failed_tests': [name for name, result in analysis['tests'].items() if result['status'] not in OK_STATUSES]
+    }
+
+class BatchAuditor:
+    """Audit a file of passwords (one per line) with resumable checkpoints"""
+
+    def __init__(self, analyzer=None, checkpoint_every=1000, checkpoint_interval=5.0, languages=None):
+        self.analyzer = analyzer or PasswordAnalyzer()
+        self.languages = languages
+        self.checkpoint_every = checkpoint_every
+        self.checkpoint_interval = checkpoint_interval
+        self.first_result_time = None
+
+    def new_aggregates(self):
+        """Return empty running totals for an audit"""
+        return {'count': 0, 'score_total': 0, 'levels': {}, 'failed_tests': {}}
+
+    def update_aggregates(self, aggregates, record):
+        """Fold one result record into the running totals"""
+        aggregates['count'] += 1
+        aggregates['score_total'] += record['total_score']
+        levels = aggregates['levels']
+        levels[record['security_level']] = levels.get(record['security_level'], 0) + 1
+        failed = aggregates['failed_tests']
+        for name in record['failed_tests']:
+            failed[name] = failed.get(name, 0) + 1
+
+    def analysis_settings(self):
+        """Describe the scoring setup, so a checkpoint is only resumed with the same one"""
+        analyzer = self.analyzer
+        model = analyzer.markov_model
+        settings = {
+            'language': analyzer.current_language,
+            'languages': self.languages,
+            'wordlists': os.path.abspath(analyzer.wordlist_dir) if analyzer.wordlist_dir else None,
+            'wordlist_signature': analyzer.wordlists.signature,
+            'markov': [model.order, model.alphabet, model.scale, zlib.crc32(model.table)] if model is not None else None
+        }
+        return json.loads(json.dumps(settings))
+
+    def load_checkpoint(self, checkpoint_path, input_path, settings):
+        """Load a checkpoint for input_path, or None if there is nothing to resume.
+
+        Raises ValueError if the checkpoint was written for another input file,
+        a modified one, or different analysis settings.
+        """
+        if not checkpoint_path or not os.path.exists(checkpoint_path):
+            return None
+        with open(checkpoint_path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        if state.get('version') != CHECKPOINT_VERSION:
+            raise ValueError(f'Unsupported checkpoint version in {checkpoint_path}')
+        stat = os.stat(input_path)
+        if (state['input'] != os.path.abspath(input_path) or state['input_size'] != stat.st_size
+                or state['input_mtime_ns'] != stat.st_mtime_ns):
+            raise ValueError(f'Checkpoint {checkpoint_path} does not match input file {input_path}')
+        if state['settings'] != settings:
+            raise ValueError(f'Checkpoint {checkpoint_path} was written with different analysis settings')
+        return state
+
+    def write_checkpoint(self, checkpoint_path, state):
+        """Atomically replace the checkpoint file with state"""
+        tmp_path = checkpoint_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, checkpoint_path)
+
+    def iter_records(self, src, input_offset=0, line_no=0):
+        """Yield (input_offset, line_no, record) for each line of the binary file src.
+
+        input_offset is the byte offset just after the line and record is None
+        for blank lines. When languages is set, each record also carries the
+        recommendations for every language, sharing the language-independent tests.
+        """
+        for raw in src:
+            input_offset += len(raw)
+            line_no += 1
+            password = raw.decode('utf-8', errors='replace').rstrip('\r\n')
+            if not password:
+                yield input_offset, line_no, None
+                continue
+            if not self.languages:
+                analysis = self.analyzer.perform_security_tests(password)
+                yield input_offset, line_no, make_record(self.analyzer, line_no, analysis)
+                continue
+            analyses = self.analyzer.perform_multilingual_tests(password, self.languages)
+            record = make_record(self.analyzer, line_no, analyses[self.languages[0]])
+            record['recommendations'] = {lang: analysis['recommendations'] for lang, analysis in analyses.items()}
+            yield input_offset, line_no, record
+
+    def run(self, input_path, output_path, checkpoint_path=None, progress=None):
+        """Audit input_path into output_path (JSON lines) and return the aggregates.
+
+        When checkpoint_path is set, progress is saved every checkpoint_every
+        records or checkpoint_interval seconds, and an existing checkpoint is
+        resumed from its saved input and output offsets.
+        """
+        settings = self.analysis_settings()
+        state = self.load_checkpoint(checkpoint_path, input_path, settings)
+        if state is None:
+            stat = os.stat(input_path)
+            state = {
+                'version': CHECKPOINT_VERSION,
+                'input': os.path.abspath(input_path),
+                'input_size': stat.st_size,
+                'input_mtime_ns': stat.st_mtime_ns,
+                'settings': settings,
+                'input_offset': 0,
+                'output_offset': 0,
+                'line': 0,
+                'aggregates': self.new_aggregates()
+            }
+        elif not os.path.exists(output_path) or os.path.getsize(output_path) < state['output_offset']:
+            raise ValueError(f'Output file {output_path} is missing or shorter than checkpoint {checkpoint_path} records')
+        aggregates = state['aggregates']
+        with open(input_path, 'rb') as src, open(output_path, 'a+b') as out:
+            out.truncate(state['output_offset'])
+            src.seek(state['input_offset'])
+            input_offset = state['input_offset']
+            pending = 0
+            last_checkpoint = time.monotonic()
+            for input_offset, line_no, record in self.iter_records(src, input_offset, state['line']):
+                if record:
+                    if self.first_result_time is None:
+                        self.first_result_time = time.perf_counter()
+                    self.update_aggregates(aggregates, record)
+                    out.write(json.dumps(record, ensure_ascii=False).encode('utf-8') + b'\n')
+                pending += 1
+                if checkpoint_path and (pending >= self.checkpoint_every or time.monotonic() - last_checkpoint >= self.checkpoint_interval):
+                    out.flush()
+                    os.fsync(out.fileno())
+                    state.update(input_offset=input_offset, output_offset=out.tell(), line=line_no)
+                    self.write_checkpoint(checkpoint_path, state)
+                    pending = 0
+                    last_checkpoint = time.monotonic()
+                    if progress:
+                        progress(input_offset, state['input_size'])
+            out.flush()
+        if checkpoint_path and os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+        if progress:
+            progress(input_offset, state['input_size'])
+        return aggregates
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Audit a file of passwords, one per line.')
+    parser.add_argument('input', help='file of passwords to audit')
+    parser.add_argument('-o', '--output', help='JSON lines results file (default: <input>.audit.jsonl)')
+    parser.add_argument('-l', '--language', default='en', help='primary dictionary language')
+    parser.add_argument('--languages', help="comma-separated languages to include recommendations for, or 'all'")
+    parser.add_argument('-w', '--wordlists', help='directory of word list files overriding the built-in lists')
+    parser.add_argument('--checkpoint', help='checkpoint file (default: <output>.ckpt)')
+    parser.add_argument('--checkpoint-every', type=int, default=1000, help='records between checkpoints')
+    parser.add_argument('--no-checkpoint', action='store_true', help='disable checkpointing')
+    parser.add_argument('--restart', action='store_true', help='discard an existing checkpoint and start over')
+    parser.add_argument('--markov', help='Markov guessability model trained with markov_model.py')
+    parser.add_argument('--snapshot', help='analyzer snapshot file, rebuilt when the word lists change')
+    parser.add_argument('--timing', action='store_true', help='report import-to-first-result time')
+    args = parser.parse_args(argv)
+    output_path = args.output or args.input + '.audit.jsonl'
+    checkpoint_path = None if args.no_checkpoint else (args.checkpoint or output_path + '.ckpt')
+    analyzer = load_analyzer(args.snapshot, args.wordlists) if args.snapshot else PasswordAnalyzer(args.wordlists)
+    if args.markov:
+        analyzer.markov_model = MarkovModel.load(args.markov)
+    ready = time.perf_counter()
+    languages = None
+    if args.languages:
+        languages = LANGUAGES if args.languages == 'all' else args.languages.split(',')
+    auditor = BatchAuditor(analyzer, checkpoint_every=args.checkpoint_every, languages=languages)
+    auditor.analyzer.set_language(args.language)
+    if args.restart and checkpoint_path and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    try:
+        aggregates = auditor.run(args.input, output_path, checkpoint_path)
+    except ValueError as error:
+        parser.error(f'{error} (use --restart to discard the checkpoint)')
+    count = aggregates['count']
+    average = aggregates['score_total'] / count if count else 0
+    print(f'Audited {count} passwords, average score {average:.1f}/100')
+    for level, total in sorted(aggregates['levels'].items(), key=lambda item: -item[1]):
+        print(f'  {level}: {total}')
+    for name, total in sorted(aggregates['failed_tests'].items(), key=lambda item: -item[1]):
+        print(f'  failed {name}: {total}')
+    print(f'Results written to {output_path}')
+    if args.timing:
+        print(f'Startup: analyzer ready {(ready - STARTED) * 1000:.1f} ms after import', file=sys.stderr)
+        if auditor.first_result_time is not None:
+            print(f'Startup: first result {(auditor.first_result_time - STARTED) * 1000:.1f} ms after import', file=sys.stderr)
+
+if __name__ == "__main__":
+    sys.exit(main())
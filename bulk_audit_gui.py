@@ -0,0 +1,381 @@
+import os
+import queue
+import threading
+import time
+import tkinter as tk
+from tkinter import ttk, filedialog
+from password_tests import PasswordAnalyzer, TEST_ORDER
+from batch_audit import BatchAuditor
+
+LEVELS = ['VERY WEAK', 'WEAK', 'MODERATE', 'STRONG', 'VERY STRONG']
+LEVEL_COLORS = ['#ff4444', '#ff8800', '#ffaa00', '#88ff44', '#00ff88']
+COLUMNS = [('line', 8), ('password', 28), ('score', 7), ('security_level', 16), ('failed_tests', 48)]
+ROW_HEIGHT = 24
+BATCH_SIZE = 500
+# Seconds between re-sorts of the view while a file is loading
+SORT_INTERVAL = 2.0
+
+LINE, PASSWORD, SCORE, LEVEL, FAILED = range(5)
+
+class BulkAuditWindow:
+    """Bulk audit view: scores a password file in the background and shows the
+    results in a virtualized table that only creates widgets for visible rows"""
+
+    def __init__(self, parent, app):
+        self.app = app
+        self.window = tk.Toplevel(parent)
+        self.window.configure(bg="#0f0f0f")
+        self.window.geometry("1100x700")
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+        self.rows = []
+        self.view = []
+        self.top = 0
+        self.row_widgets = []
+        self.sort_column = None
+        self.sort_reverse = False
+        self.worker = None
+        self.cancel_event = threading.Event()
+        self.results = queue.Queue()
+        self.file_size = 1
+        self.file_name = ''
+        self.error = None
+        self.next_sort = 0.0
+        self.create_widgets()
+        self.update_interface_language()
+
+    def get_text(self, key):
+        return self.app.get_text(key)
+
+    def create_widgets(self):
+        header = tk.Frame(self.window, bg="#1a1a1a")
+        header.pack(fill="x")
+        header_text = tk.Frame(header, bg="#1a1a1a")
+        header_text.pack(side="left", padx=30, pady=20)
+        self.title_label = tk.Label(header_text, font=("Segoe UI", 18, "bold"), fg="#ffffff", bg="#1a1a1a")
+        self.title_label.pack(anchor="w")
+        self.desc_label = tk.Label(header_text, font=("Segoe UI", 11), fg="#888888", bg="#1a1a1a")
+        self.desc_label.pack(anchor="w")
+        buttons = tk.Frame(header, bg="#1a1a1a")
+        buttons.pack(side="right", padx=30)
+        self.load_btn = tk.Button(buttons, font=("Segoe UI", 10, "bold"), fg="#00ff88", bg="#2d2d2d",
+                                  relief="flat", bd=0, cursor="hand2", padx=12, pady=6,
+                                  command=self.load_file)
+        self.load_btn.pack(side="left", padx=(0, 10))
+        self.cancel_btn = tk.Button(buttons, font=("Segoe UI", 10, "bold"), fg="#888888", bg="#1a1a1a",
+                                    relief="flat", bd=0, cursor="hand2", padx=12, pady=6,
+                                    state="disabled", command=self.cancel)
+        self.cancel_btn.pack(side="left")
+        progress_frame = tk.Frame(self.window, bg="#0f0f0f")
+        progress_frame.pack(fill="x", padx=30, pady=(15, 0))
+        self.progress = ttk.Progressbar(progress_frame, mode='determinate', maximum=100,
+                                        style="Modern.Horizontal.TProgressbar")
+        self.progress.pack(fill="x")
+        self.status_label = tk.Label(progress_frame, text="", font=("Segoe UI", 9), fg="#888888", bg="#0f0f0f")
+        self.status_label.pack(anchor="w", pady=(5, 0))
+        filters = tk.Frame(self.window, bg="#0f0f0f")
+        filters.pack(fill="x", padx=30, pady=(10, 10))
+        self.min_score_var = tk.IntVar(value=0)
+        self.max_score_var = tk.IntVar(value=100)
+        self.level_var = tk.StringVar()
+        self.failed_var = tk.StringVar()
+        self.min_score_label = tk.Label(filters, font=("Segoe UI", 9), fg="#888888", bg="#0f0f0f")
+        self.min_score_label.pack(side="left")
+        tk.Spinbox(filters, from_=0, to=100, width=4, textvariable=self.min_score_var,
+                   command=self.apply_filters).pack(side="left", padx=(5, 15))
+        self.max_score_label = tk.Label(filters, font=("Segoe UI", 9), fg="#888888", bg="#0f0f0f")
+        self.max_score_label.pack(side="left")
+        tk.Spinbox(filters, from_=0, to=100, width=4, textvariable=self.max_score_var,
+                   command=self.apply_filters).pack(side="left", padx=(5, 15))
+        self.level_label = tk.Label(filters, font=("Segoe UI", 9), fg="#888888", bg="#0f0f0f")
+        self.level_label.pack(side="left")
+        self.level_combo = ttk.Combobox(filters, textvariable=self.level_var, state="readonly", width=16)
+        self.level_combo.pack(side="left", padx=(5, 15))
+        self.level_combo.bind("<<ComboboxSelected>>", self.apply_filters)
+        self.failed_label = tk.Label(filters, font=("Segoe UI", 9), fg="#888888", bg="#0f0f0f")
+        self.failed_label.pack(side="left")
+        self.failed_combo = ttk.Combobox(filters, textvariable=self.failed_var, state="readonly", width=20)
+        self.failed_combo.pack(side="left", padx=(5, 0))
+        self.failed_combo.bind("<<ComboboxSelected>>", self.apply_filters)
+        for spinbox in filters.winfo_children():
+            if isinstance(spinbox, tk.Spinbox):
+                spinbox.bind("<Return>", self.apply_filters)
+                spinbox.bind("<FocusOut>", self.apply_filters)
+        table = tk.Frame(self.window, bg="#1a1a1a")
+        table.pack(fill="both", expand=True, padx=30, pady=(0, 30))
+        self.header_row = tk.Frame(table, bg="#2d2d2d")
+        self.header_row.pack(fill="x")
+        self.header_labels = []
+        for index, (key, width) in enumerate(COLUMNS):
+            label = tk.Label(self.header_row, width=width, anchor="w", font=("Segoe UI", 10, "bold"),
+                             fg="#ffffff", bg="#2d2d2d", cursor="hand2")
+            label.pack(side="left", padx=2, pady=4)
+            label.bind("<Button-1>", lambda event, column=index: self.sort_by(column))
+            self.header_labels.append(label)
+        body = tk.Frame(table, bg="#1a1a1a")
+        body.pack(fill="both", expand=True)
+        self.scrollbar = ttk.Scrollbar(body, orient="vertical", command=self.yview)
+        self.scrollbar.pack(side="right", fill="y")
+        self.rows_frame = tk.Frame(body, bg="#1a1a1a")
+        self.rows_frame.pack(side="left", fill="both", expand=True)
+        self.rows_frame.pack_propagate(False)
+        self.rows_frame.bind("<Configure>", self.on_resize)
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.window.bind(sequence, self.on_mousewheel)
+
+    def update_interface_language(self):
+        """Update all labels with the current application language"""
+        self.window.title(self.get_text('bulk_audit_title'))
+        self.title_label.config(text=self.get_text('bulk_audit_title'))
+        self.desc_label.config(text=self.get_text('bulk_audit_desc'))
+        self.load_btn.config(text=self.get_text('load_file'))
+        self.cancel_btn.config(text=self.get_text('cancel'))
+        self.min_score_label.config(text=self.get_text('min_score'))
+        self.max_score_label.config(text=self.get_text('max_score'))
+        self.level_label.config(text=self.get_text('security_level'))
+        self.failed_label.config(text=self.get_text('failed_tests'))
+        level_index = self.level_combo.current()
+        failed_index = self.failed_combo.current()
+        self.level_combo['values'] = [self.get_text('all')] + [self.level_text(level) for level in range(len(LEVELS))]
+        self.failed_combo['values'] = [self.get_text('all')] + [self.get_text(name) for name in TEST_ORDER]
+        self.level_combo.current(max(level_index, 0))
+        self.failed_combo.current(max(failed_index, 0))
+        for index, (key, width) in enumerate(COLUMNS):
+            arrow = ''
+            if index == self.sort_column:
+                arrow = ' ▼' if self.sort_reverse else ' ▲'
+            self.header_labels[index].config(text=self.get_text(key) + arrow)
+        self.update_status()
+        self.render()
+
+    def level_text(self, level):
+        return self.get_text(LEVELS[level].lower().replace(' ', '_'))
+
+    def load_file(self):
+        path = filedialog.askopenfilename(parent=self.window)
+        if not path:
+            return
+        self.cancel()
+        if self.worker:
+            self.worker.join()
+        self.rows = []
+        self.view = []
+        self.top = 0
+        self.results = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.error = None
+        self.next_sort = 0.0
+        self.file_size = os.path.getsize(path) or 1
+        self.file_name = os.path.basename(path)
+        self.progress['value'] = 0
+        self.cancel_btn.config(state="normal")
+        self.worker = threading.Thread(target=self.score_file,
+                                       args=(path, self.app.current_language, self.results, self.cancel_event),
+                                       daemon=True)
+        self.worker.start()
+        self.update_status()
+        self.render()
+        self.window.after(100, self.poll_results, self.results)
+
+    def score_file(self, path, language, results, cancel_event):
+        """Worker thread: score path and post batches of rows to results.
+
+        The worker gets its own analyzer so its language is independent of the
+        main window, but shares the main analyzer's word lists, walk table and
+        Markov model. An error is posted as the exception itself, and None is
+        always posted last.
+        """
+        try:
+            shared = self.app.analyzer
+            analyzer = PasswordAnalyzer(shared.wordlist_dir, wordlists=shared.wordlists,
+                                        walk_table=shared.walk_table, markov_model=shared.markov_model)
+            analyzer.set_language(language)
+            auditor = BatchAuditor(analyzer)
+            batch = []
+            input_offset = 0
+            with open(path, 'rb') as src:
+                for input_offset, line_no, record in auditor.iter_records(src):
+                    if cancel_event.is_set():
+                        break
+                    if record:
+                        failed = 0
+                        for name in record['failed_tests']:
+                            failed |= 1 << TEST_ORDER.index(name)
+                        batch.append((line_no, record['password'], record['total_score'],
+                                      LEVELS.index(record['security_level']), failed))
+                    if len(batch) >= BATCH_SIZE:
+                        results.put((input_offset, batch))
+                        batch = []
+            results.put((input_offset, batch))
+        except Exception as error:
+            results.put(error)
+        finally:
+            results.put(None)
+
+    def poll_results(self, results):
+        if results is not self.results or not self.window.winfo_exists():
+            return
+        finished = False
+        offset = None
+        new_rows = []
+        try:
+            while True:
+                item = results.get_nowait()
+                if item is None:
+                    finished = True
+                    break
+                if isinstance(item, Exception):
+                    self.error = item
+                    continue
+                offset, batch = item
+                new_rows.extend(batch)
+        except queue.Empty:
+            pass
+        if new_rows or finished:
+            start = len(self.rows)
+            self.rows.extend(new_rows)
+            match = self.row_filter()
+            self.view.extend(index for index in range(start, len(self.rows)) if match(self.rows[index]))
+            # Re-sorting a large view is slow, so while loading it is throttled to
+            # SORT_INTERVAL, or ten times the last sort's duration if that is longer
+            if self.sort_column is not None and (finished or time.monotonic() >= self.next_sort):
+                started = time.monotonic()
+                self.sort_view()
+                self.next_sort = time.monotonic() + max(SORT_INTERVAL, 10 * (time.monotonic() - started))
+            self.render()
+        if offset is not None:
+            self.progress['value'] = 100 * offset / self.file_size
+        if finished:
+            self.worker.join()
+            self.cancel_btn.config(state="disabled")
+            if not self.cancel_event.is_set():
+                self.progress['value'] = 100
+        else:
+            self.window.after(100, self.poll_results, results)
+        self.update_status()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def close(self):
+        self.cancel()
+        self.window.destroy()
+        self.app.bulk_audit_window = None
+
+    def row_filter(self):
+        """Return a predicate for the current score, level and failed test filters"""
+        try:
+            min_score = int(self.min_score_var.get())
+            max_score = int(self.max_score_var.get())
+        except (tk.TclError, ValueError):
+            min_score, max_score = 0, 100
+        level = self.level_combo.current() - 1
+        failed_index = self.failed_combo.current() - 1
+        failed_mask = 1 << failed_index if failed_index >= 0 else 0
+        def match(row):
+            if not min_score <= row[SCORE] <= max_score:
+                return False
+            if level >= 0 and row[LEVEL] != level:
+                return False
+            return not failed_mask or bool(row[FAILED] & failed_mask)
+        return match
+
+    def apply_filters(self, event=None):
+        match = self.row_filter()
+        rows = self.rows
+        self.view = [index for index in range(len(rows)) if match(rows[index])]
+        if self.sort_column is not None:
+            self.sort_view()
+        self.top = 0
+        self.update_status()
+        self.render()
+
+    def sort_key(self, column):
+        rows = self.rows
+        if column == FAILED:
+            return lambda index: bin(rows[index][FAILED]).count('1')
+        return lambda index: rows[index][column]
+
+    def sort_view(self):
+        self.view.sort(key=self.sort_key(self.sort_column), reverse=self.sort_reverse)
+
+    def sort_by(self, column):
+        if self.sort_column == column:
+            self.sort_reverse = not self.sort_reverse
+        else:
+            self.sort_column = column
+            self.sort_reverse = False
+        self.sort_view()
+        self.top = 0
+        self.update_interface_language()
+
+    def update_status(self):
+        if not self.worker:
+            return
+        text = self.get_text('results_count').format(shown=len(self.view), total=len(self.rows))
+        if self.error is not None:
+            text = f"{self.get_text('load_failed').format(error=self.error)} - {text}"
+        elif self.cancel_event.is_set():
+            text = f"{self.get_text('cancelled')} - {text}"
+        elif self.worker.is_alive():
+            text = f"{self.get_text('loading_file').format(name=self.file_name)} {text}"
+        self.status_label.config(text=text)
+
+    def visible_count(self):
+        return len(self.row_widgets)
+
+    def on_resize(self, event):
+        wanted = max(1, event.height // ROW_HEIGHT)
+        while len(self.row_widgets) < wanted:
+            row_frame = tk.Frame(self.rows_frame, bg="#1a1a1a", height=ROW_HEIGHT)
+            row_frame.pack(fill="x")
+            row_frame.pack_propagate(False)
+            cells = []
+            for key, width in COLUMNS:
+                cell = tk.Label(row_frame, width=width, anchor="w", font=("Consolas", 10),
+                                fg="#ffffff", bg="#1a1a1a")
+                cell.pack(side="left", padx=2)
+                cells.append(cell)
+            self.row_widgets.append(cells)
+        while len(self.row_widgets) > wanted:
+            self.row_widgets.pop()[0].master.destroy()
+        self.render()
+
+    def yview(self, *args):
+        visible = self.visible_count()
+        total = len(self.view)
+        if args[0] == 'moveto':
+            self.top = int(float(args[1]) * total)
+        elif args[0] == 'scroll':
+            step = int(args[1])
+            self.top += step * visible if args[2] == 'pages' else step
+        self.top = max(0, min(self.top, total - visible))
+        self.render()
+
+    def on_mousewheel(self, event):
+        if event.num == 4 or getattr(event, 'delta', 0) > 0:
+            self.yview('scroll', -3, 'units')
+        else:
+            self.yview('scroll', 3, 'units')
+
+    def render(self):
+        """Fill the pooled row widgets with the rows currently scrolled into view"""
+        total = len(self.view)
+        visible = self.visible_count()
+        self.top = max(0, min(self.top, total - visible))
+        for offset, cells in enumerate(self.row_widgets):
+            position = self.top + offset
+            if position >= total:
+                for cell in cells:
+                    cell.config(text="")
+                continue
+            row = self.rows[self.view[position]]
+            failed = ', '.join(self.get_text(name) for bit, name in enumerate(TEST_ORDER) if row[FAILED] >> bit & 1)
+            cells[LINE].config(text=str(row[LINE]))
+            cells[PASSWORD].config(text=row[PASSWORD])
+            cells[SCORE].config(text=f"{row[SCORE]}/100")
+            cells[LEVEL].config(text=self.level_text(row[LEVEL]), fg=LEVEL_COLORS[row[LEVEL]])
+            cells[FAILED].config(text=failed)
+        if total:
+            self.scrollbar.set(self.top / total, min(1.0, (self.top + visible) / total))
+        else:
+            self.scrollbar.set(0, 1)
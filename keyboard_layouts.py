@@ -0,0 +1,106 @@
+from functools import lru_cache
+
+KEYBOARD_LAYOUTS = {
+    'qwerty': [
+        (0, "`1234567890-=", "~!@#$%^&*()_+"),
+        (1, "qwertyuiop[]\\", "QWERTYUIOP{}|"),
+        (1, "asdfghjkl;'", "ASDFGHJKL:\""),
+        (1, "zxcvbnm,./", "ZXCVBNM<>?")
+    ],
+    'azerty': [
+        (0, "²&é\"'(-è_çà)=", " 1234567890°+"),
+        (1, "azertyuiop^$", "AZERTYUIOP¨£"),
+        (1, "qsdfghjklmù*", "QSDFGHJKLM%µ"),
+        (0, "<wxcvbn,;:!", ">WXCVBN?./§")
+    ],
+    'qwertz': [
+        (0, "^1234567890ß´", "°!\"§$%&/()=?`"),
+        (1, "qwertzuiopü+", "QWERTZUIOPÜ*"),
+        (1, "asdfghjklöä#", "ASDFGHJKLÖÄ'"),
+        (0, "<yxcvbnm,.-", ">YXCVBNM;:_")
+    ],
+    'jcuken': [
+        (0, "ё1234567890-=", "Ё!\"№;%:?*()_+"),
+        (1, "йцукенгшщзхъ\\", "ЙЦУКЕНГШЩЗХЪ/"),
+        (1, "фывапролджэ", "ФЫВАПРОЛДЖЭ"),
+        (1, "ячсмитьбю.", "ЯЧСМИТЬБЮ,")
+    ]
+}
+
+# Neighbours on a staggered keyboard where each row sits half a key right of the one above
+DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (1, -1), (-1, 1), (0, 1)]
+
+# Bump when key_positions or build_walk_table change, so saved walk tables are rebuilt
+WALK_TABLE_VERSION = 1
+
+# Shortest walk reported; it must be a straight run, and every two keys beyond it allow one more turn.
+# Walks of exactly this length are only a weak signal, longer ones a strong one.
+MIN_WALK_LENGTH = 3
+
+def max_walk_turns(length, min_length=MIN_WALK_LENGTH):
+    """Most direction changes a walk of length keys may have and still count as a walk"""
+    return (length - min_length) // 2
+
+def key_positions(rows):
+    """Map each (lowercased) character of a layout to its (x, y) key position"""
+    positions = {}
+    for y, (offset, unshifted, shifted) in enumerate(rows):
+        for x, (plain, shift) in enumerate(zip(unshifted, shifted), offset):
+            for char in (plain, shift.lower()):
+                if char != ' ':
+                    positions.setdefault(char, (x, y))
+    return positions
+
+def build_walk_table(layouts):
+    """Precompute {two-char string: ((layout, direction), ...)} for every pair of adjacent keys"""
+    table = {}
+    for layout, rows in layouts.items():
+        positions = key_positions(rows)
+        keys_at = {}
+        for char, position in positions.items():
+            keys_at.setdefault(position, []).append(char)
+        for char, (x, y) in positions.items():
+            for direction, (dx, dy) in enumerate(DIRECTIONS):
+                for neighbour in keys_at.get((x + dx, y + dy), ()):
+                    table.setdefault(char + neighbour, []).append((layout, direction))
+    return {pair: tuple(steps) for pair, steps in table.items()}
+
+@lru_cache(maxsize=None)
+def default_walk_table():
+    """Walk table for KEYBOARD_LAYOUTS, built once on first use"""
+    return build_walk_table(KEYBOARD_LAYOUTS)
+
+def find_keyboard_walks(text, min_length=MIN_WALK_LENGTH, table=None):
+    """Find runs of adjacent keys in text in a single pass.
+
+    Returns a list of dicts with the walk, its start, length, number of
+    direction changes ('turns') and layout, longest walks first. A step that
+    repeats a two-step cycle, as in '1q2w3e4r', is not a turn. Runs with
+    more turns than max_walk_turns allows, like 'were', are not walks. Overlapping
+    walks found on several layouts are reported once, with the fewest turns,
+    and walks contained in a longer one are dropped.
+    """
+    if table is None:
+        table = default_walk_table()
+    text = text.lower()
+    found = {}
+    active = {}
+    for i in range(1, len(text) + 1):
+        following = {}
+        for layout, direction in table.get(text[i - 1:i + 1], ()):
+            start, last, before, turns = active.get(layout, (i - 1, direction, direction, 0))
+            turned = direction != last and direction != before
+            following[layout] = (start, direction, last, turns + turned)
+        for layout, (start, last, before, turns) in active.items():
+            if layout not in following and i - start >= min_length and turns <= max_walk_turns(i - start, min_length):
+                best = found.get((start, i))
+                if best is None or turns < best['turns']:
+                    found[(start, i)] = {'walk': text[start:i], 'start': start, 'length': i - start,
+                                         'turns': turns, 'layout': layout}
+        active = following
+    walks = []
+    for walk in sorted(found.values(), key=lambda walk: (-walk['length'], walk['turns'], walk['start'])):
+        end = walk['start'] + walk['length']
+        if not any(kept['start'] <= walk['start'] and end <= kept['start'] + kept['length'] for kept in walks):
+            walks.append(walk)
+    return walks
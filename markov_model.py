@@ -0,0 +1,160 @@
+import argparse
+import math
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections import Counter, defaultdict
+
+MODEL_MAGIC = b'PWMARKOV'
+MODEL_VERSION = 2
+HEADER = struct.Struct('<8sHHHHI')
+BOUNDARY = 0
+OTHER = 1
+
+def capitalization_bits(password):
+    """Bits needed to guess where the capitals go once the lowercase password is known.
+
+    Like zxcvbn, a capitalized first or last letter or an all-caps password
+    costs one bit, other mixes log2 of the placements of the rarer case.
+    """
+    if password == password.lower():
+        return 0.0
+    upper = sum(map(str.isupper, password))
+    lower = sum(map(str.islower, password))
+    if not lower or (upper == 1 and (password[0].isupper() or password[-1].isupper())):
+        return 1.0
+    return math.log2(sum(math.comb(upper + lower, count) for count in range(1, min(upper, lower) + 1)))
+
+class MarkovModel:
+    """Character n-gram guessability model with quantized cost tables.
+
+    The model is case-folded: passwords are scored in lowercase and
+    capitalization_bits is added on top. The table holds, for every context of
+    order - 1 previous symbols and every next symbol, -log2(p) in 1/scale bit
+    steps as an unsigned byte. Symbol 0 marks the start and end of a password,
+    symbol 1 stands for characters outside the trained alphabet. Scoring is
+    one table lookup per character.
+    """
+
+    def __init__(self, order, alphabet, scale, table, data=None):
+        self.order = order
+        self.alphabet = alphabet
+        self.scale = scale
+        self.table = table
+        self.data = data
+        self.size = len(alphabet) + 2
+        self.context_count = self.size ** (order - 1)
+        self.index = {char: position + 2 for position, char in enumerate(alphabet)}
+
+    @classmethod
+    def load(cls, path):
+        """Map a model file written by save() without copying its table.
+
+        Raises ValueError if the file is not a model of this version or is
+        shorter than its header says.
+        """
+        with open(path, 'rb') as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(data) < HEADER.size:
+            data.close()
+            raise ValueError(f'Truncated Markov model file: {path}')
+        magic, version, order, size, scale, alphabet_length = HEADER.unpack_from(data, 0)
+        if magic != MODEL_MAGIC or version != MODEL_VERSION:
+            data.close()
+            raise ValueError(f'Unsupported Markov model file: {path}')
+        offset = HEADER.size + alphabet_length
+        if len(data) < offset + size ** order:
+            data.close()
+            raise ValueError(f'Truncated Markov model file: {path}')
+        alphabet = data[HEADER.size:offset].decode('utf-8')
+        table = memoryview(data)[offset:offset + size ** order]
+        return cls(order, alphabet, scale, table, data)
+
+    def save(self, path):
+        """Atomically write the model to path"""
+        alphabet = self.alphabet.encode('utf-8')
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(HEADER.pack(MODEL_MAGIC, MODEL_VERSION, self.order, self.size, self.scale, len(alphabet)))
+            f.write(alphabet)
+            f.write(self.table)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def guess_bits(self, password):
+        """Estimated guessing cost of password in bits (-log2 of its probability)"""
+        table = self.table
+        index = self.index
+        size = self.size
+        context_count = self.context_count
+        context = 0
+        cost = 0
+        for char in password.lower():
+            symbol = index.get(char, OTHER)
+            cost += table[context * size + symbol]
+            context = (context * size + symbol) % context_count
+        cost += table[context * size + BOUNDARY]
+        return cost / self.scale + capitalization_bits(password)
+
+def train_model(passwords, order=3, max_alphabet=95, scale=8):
+    """Train a MarkovModel from an iterable of passwords.
+
+    Passwords are case-folded, as the model scores capitalization separately.
+    Probabilities are interpolated down to a uniform distribution with
+    Witten-Bell smoothing, then quantized to bytes, so unseen contexts still
+    cost a single lookup.
+    """
+    passwords = [password.lower() for password in passwords if password]
+    char_counts = Counter(char for password in passwords for char in password if char != '\0')
+    alphabet = ''.join(char for char, _ in char_counts.most_common(min(max_alphabet, 254)))
+    index = {char: position + 2 for position, char in enumerate(alphabet)}
+    size = len(alphabet) + 2
+    counts = [defaultdict(Counter) for _ in range(order)]
+    for password in passwords:
+        symbols = [BOUNDARY] * (order - 1) + [index.get(char, OTHER) for char in password] + [BOUNDARY]
+        for position in range(order - 1, len(symbols)):
+            for length in range(order):
+                counts[length][tuple(symbols[position - length:position])][symbols[position]] += 1
+    rows = {}
+    def row(context):
+        if context in rows:
+            return rows[context]
+        lower = row(context[1:]) if context else [1.0 / size] * size
+        followers = counts[len(context)].get(context)
+        if not followers:
+            rows[context] = lower
+            return lower
+        total = sum(followers.values())
+        types = len(followers)
+        probabilities = [(followers.get(symbol, 0) + types * lower[symbol]) / (total + types) for symbol in range(size)]
+        rows[context] = probabilities
+        return probabilities
+    table = array('B')
+    for context_number in range(size ** (order - 1)):
+        context = []
+        for _ in range(order - 1):
+            context_number, symbol = divmod(context_number, size)
+            context.append(symbol)
+        probabilities = row(tuple(reversed(context)))
+        table.extend(min(255, round(-math.log2(probability) * scale)) for probability in probabilities)
+    return MarkovModel(order, alphabet, scale, table)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Train a Markov guessability model from a password corpus.')
+    parser.add_argument('corpus', help='file of passwords, one per line')
+    parser.add_argument('output', help='model file to write')
+    parser.add_argument('--order', type=int, default=3, help='n-gram order (characters of context + 1)')
+    parser.add_argument('--alphabet', type=int, default=95, help='most frequent characters to model individually')
+    args = parser.parse_args(argv)
+    with open(args.corpus, 'r', encoding='utf-8', errors='replace') as f:
+        passwords = [line.rstrip('\r\n') for line in f]
+    model = train_model(passwords, args.order, args.alphabet)
+    model.save(args.output)
+    print(f'Trained order-{model.order} model on {len(passwords)} passwords, '
+          f'{model.size} symbols, {len(model.table)} byte table written to {args.output}')
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+from collections import Counter
+from password_tests import PasswordAnalyzer
+
+# Highest total score for a reused password (VERY WEAK) and a near copy (WEAK)
+REUSED_SCORE_CAP = 20
+SIMILAR_SCORE_CAP = 40
+
+def compile_pattern(text):
+    """Precompute the per-character match bitmasks used by myers_distance"""
+    peq = {}
+    for i, char in enumerate(text):
+        peq[char] = peq.get(char, 0) | (1 << i)
+    return peq
+
+def myers_distance(a, b, max_distance=None, peq=None):
+    """Levenshtein distance between a and b using Myers' bit-parallel algorithm
+    (Hyyrö's formulation), one column of the DP matrix per character of b.
+
+    With max_distance set, returns max_distance + 1 as soon as the distance is
+    known to exceed it. peq can be passed in from compile_pattern(a) when a is
+    compared against many strings.
+    """
+    m = len(a)
+    if m == 0:
+        return len(b) if max_distance is None else min(len(b), max_distance + 1)
+    if peq is None:
+        peq = compile_pattern(a)
+    mask = (1 << m) - 1
+    last = 1 << (m - 1)
+    pv = mask
+    mv = 0
+    score = m
+    remaining = len(b)
+    for char in b:
+        eq = peq.get(char, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | ~(xh | pv)
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        ph = (ph << 1) | 1
+        mh = mh << 1
+        pv = (mh | ~(xv | ph)) & mask
+        mv = ph & xv & mask
+        remaining -= 1
+        if max_distance is not None and score - remaining > max_distance:
+            return max_distance + 1
+    return score if max_distance is None else min(score, max_distance + 1)
+
+def ngrams(text, size):
+    return Counter(text[i:i + size] for i in range(len(text) - size + 1))
+
+class PasswordHistoryChecker:
+    """Reject passwords that are trivial edits of a user's previous passwords"""
+
+    def __init__(self, analyzer=None, max_distance=2, ngram_size=2, ignore_case=True):
+        self.analyzer = analyzer or PasswordAnalyzer()
+        self.max_distance = max_distance
+        self.ngram_size = ngram_size
+        self.ignore_case = ignore_case
+
+    def normalize(self, password):
+        return password.lower() if self.ignore_case else password
+
+    def closest_match(self, password, history):
+        """Return (distance, index) of the closest previous password within
+        max_distance, or (None, None) if none is that close.
+
+        Candidates are first screened by length difference and by the q-gram
+        lemma (strings within distance k share at least
+        max(len) - q + 1 - k * q q-grams), so the bit-parallel distance only
+        runs on plausible matches.
+        """
+        k = self.max_distance
+        q = self.ngram_size
+        text = self.normalize(password)
+        peq = compile_pattern(text)
+        grams = None
+        best = (None, None)
+        for index, previous in enumerate(history):
+            previous = self.normalize(previous)
+            if abs(len(previous) - len(text)) > k:
+                continue
+            required = max(len(text), len(previous)) - q + 1 - k * q
+            if required > 0:
+                if grams is None:
+                    grams = ngrams(text, q)
+                shared = sum((grams & ngrams(previous, q)).values())
+                if shared < required:
+                    continue
+            distance = myers_distance(text, previous, k, peq)
+            if distance <= k and (best[0] is None or distance < best[0]):
+                best = (distance, index)
+                if distance == 0:
+                    break
+        return best
+
+    def test_password_history(self, password, history):
+        """Test the password against a user's previous passwords"""
+        distance, index = self.closest_match(password, history)
+        if distance is None:
+            return {'score': 10, 'status': 'PASS', 'message': 'Not similar to previous passwords.'}
+        if distance == 0:
+            message = 'Same as a previous password.'
+        else:
+            message = f'Too similar to a previous password ({distance} edit{"s" if distance > 1 else ""} away).'
+        return {'score': 0, 'status': 'FAIL', 'message': message, 'distance': distance, 'history_index': index}
+
+    def analyze(self, password, history):
+        """Run the analyzer's security tests plus the history check.
+
+        The history test counts towards the total like the other tests, and a
+        reused or near-copied password has its total capped so it can never
+        rate above VERY WEAK or WEAK respectively.
+        """
+        analysis = self.analyzer.perform_security_tests(password)
+        tests = analysis['tests']
+        result = tests['password_history'] = self.test_password_history(password, history)
+        total_score = min(100, sum(test['score'] for test in tests.values()))
+        if result['status'] == 'FAIL':
+            total_score = min(total_score, REUSED_SCORE_CAP if result['distance'] == 0 else SIMILAR_SCORE_CAP)
+        analysis['total_score'] = total_score
+        analysis['recommendations'] = self.analyzer.generate_recommendations(tests)
+        # The shared language-independent results no longer match these tests
+        del analysis['shared']
+        return analysis
+
+    def check_batch(self, entries):
+        """Yield test_password_history results for (password, history) pairs"""
+        for password, history in entries:
+            yield self.test_password_history(password, history)
@@ -1,56 +1,215 @@
 import re
 import math
+import threading
+from keyboard_layouts import MIN_WALK_LENGTH, find_keyboard_walks
+from wordlists import load_wordlists, wordlist_signature
+
+TEST_ORDER = ['length', 'character_variety', 'common_patterns', 'dictionary_words',
+              'repetition', 'entropy', 'keyboard_patterns', 'personal_info']
+LANGUAGES = ['en', 'fr', 'es', 'it', 'de', 'ru']
+
+RECOMMENDATION_MESSAGES = {
+    'en': {
+        'length': "• Increase password length to at least 12 characters",
+        'variety': "• Use a mix of uppercase, lowercase, numbers, and symbols",
+        'patterns': "• Avoid common patterns and dictionary words",
+        'entropy': "• Increase randomness and unpredictability",
+        'keyboard': "• Avoid keyboard patterns like 'qwerty' or '123456'",
+        'repetition': "• Avoid repeating characters or patterns",
+        'personal': "• Avoid personal information like birth years or names",
+        'history': "• Do not reuse or slightly modify a previous password",
+        'good1': "• Your password meets security standards",
+        'good2': "• Consider using a password manager for unique passwords",
+        'good3': "• Change passwords regularly for sensitive accounts"
+    },
+    'fr': {
+        'length': "• Augmentez la longueur du mot de passe à au moins 12 caractères",
+        'variety': "• Utilisez un mélange de majuscules, minuscules, chiffres et symboles",
+        'patterns': "• Évitez les motifs communs et les mots du dictionnaire",
+        'entropy': "• Augmentez le caractère aléatoire et l'imprévisibilité",
+        'keyboard': "• Évitez les motifs de clavier comme 'qwerty' ou '123456'",
+        'repetition': "• Évitez la répétition de caractères ou de motifs",
+        'personal': "• Évitez les informations personnelles comme les années de naissance",
+        'history': "• Ne réutilisez pas et ne modifiez pas légèrement un ancien mot de passe",
+        'good1': "• Votre mot de passe respecte les normes de sécurité",
+        'good2': "• Envisagez d'utiliser un gestionnaire de mots de passe",
+        'good3': "• Changez régulièrement les mots de passe des comptes sensibles"
+    },
+    'es': {
+        'length': "• Aumente la longitud de la contraseña a al menos 12 caracteres",
+        'variety': "• Use una mezcla de mayúsculas, minúsculas, números y símbolos",
+        'patterns': "• Evite patrones comunes y palabras del diccionario",
+        'entropy': "• Aumente la aleatoriedad e impredecibilidad",
+        'keyboard': "• Evite patrones de teclado como 'qwerty' o '123456'",
+        'repetition': "• Evite repetir caracteres o patrones",
+        'personal': "• Evite información personal como años de nacimiento",
+        'history': "• No reutilice ni modifique ligeramente una contraseña anterior",
+        'good1': "• Su contraseña cumple con los estándares de seguridad",
+        'good2': "• Considere usar un administrador de contraseñas",
+        'good3': "• Cambie las contraseñas regularmente para cuentas sensibles"
+    },
+    'it': {
+        'length': "• Aumentare la lunghezza della password ad almeno 12 caratteri",
+        'variety': "• Usare un mix di maiuscole, minuscole, numeri e simboli",
+        'patterns': "• Evitare pattern comuni e parole del dizionario",
+        'entropy': "• Aumentare casualità e imprevedibilità",
+        'keyboard': "• Evitare pattern di tastiera come 'qwerty' o '123456'",
+        'repetition': "• Evitare ripetizioni di caratteri o pattern",
+        'personal': "• Evitare informazioni personali come anni di nascita",
+        'history': "• Non riutilizzare né modificare leggermente una password precedente",
+        'good1': "• La tua password soddisfa gli standard di sicurezza",
+        'good2': "• Considera l'uso di un gestore di password",
+        'good3': "• Cambia regolarmente le password per account sensibili"
+    },
+    'de': {
+        'length': "• Erhöhen Sie die Passwortlänge auf mindestens 12 Zeichen",
+        'variety': "• Verwenden Sie eine Mischung aus Groß-, Kleinbuchstaben, Zahlen und Symbolen",
+        'patterns': "• Vermeiden Sie häufige Muster und Wörterbuch-Wörter",
+        'entropy': "• Erhöhen Sie Zufälligkeit und Unvorhersagbarkeit",
+        'keyboard': "• Vermeiden Sie Tastaturmuster wie 'qwerty' oder '123456'",
+        'repetition': "• Vermeiden Sie wiederholende Zeichen oder Muster",
+        'personal': "• Vermeiden Sie persönliche Informationen wie Geburtsjahre",
+        'history': "• Verwenden Sie kein früheres Passwort erneut, auch nicht leicht abgeändert",
+        'good1': "• Ihr Passwort erfüllt die Sicherheitsstandards",
+        'good2': "• Erwägen Sie die Verwendung eines Passwort-Managers",
+        'good3': "• Ändern Sie Passwörter regelmäßig für sensible Konten"
+    },
+    'ru': {
+        'length': "• Увеличьте длину пароля до минимум 12 символов",
+        'variety': "• Используйте смесь заглавных, строчных букв, цифр и символов",
+        'patterns': "• Избегайте общих шаблонов и словарных слов",
+        'entropy': "• Увеличьте случайность и непредсказуемость",
+        'keyboard': "• Избегайте клавиатурных шаблонов как 'qwerty' или '123456'",
+        'repetition': "• Избегайте повторения символов или шаблонов",
+        'personal': "• Избегайте личной информации как годы рождения",
+        'history': "• Не используйте повторно и не изменяйте слегка прежний пароль",
+        'good1': "• Ваш пароль соответствует стандартам безопасности",
+        'good2': "• Рассмотрите использование менеджера паролей",
+        'good3': "• Регулярно меняйте пароли для важных аккаунтов"
+    }
+}
 
 class PasswordAnalyzer:
     """Class containing all password testing and analysis methods"""
     
-    def __init__(self):
-        self.dictionary_words = {
-            'en': ['password', 'admin', 'user', 'login', 'welcome', 'hello', 'computer', 'security', 'system', 'server', 'network', 'internet', 'manager', 'service', 'access', 'account', 'database', 'windows', 'microsoft', 'google', 'facebook', 'twitter', 'linkedin', 'instagram', 'youtube', 'amazon', 'apple', 'samsung', 'netflix', 'spotify'],
-            'fr': ['motdepasse', 'administrateur', 'utilisateur', 'connexion', 'bienvenue', 'bonjour', 'ordinateur', 'sécurité', 'système', 'serveur', 'réseau', 'internet', 'gestionnaire', 'service', 'accès', 'compte', 'france', 'paris', 'lyon', 'marseille', 'toulouse', 'nice', 'nantes', 'bordeaux', 'lille', 'rennes'],
-            'es': ['contraseña', 'administrador', 'usuario', 'iniciosesion', 'bienvenido', 'hola', 'computadora', 'seguridad', 'sistema', 'servidor', 'red', 'internet', 'gerente', 'servicio', 'acceso', 'cuenta', 'españa', 'madrid', 'barcelona', 'valencia', 'sevilla', 'zaragoza', 'málaga', 'murcia', 'palmas', 'bilbao'],
-            'it': ['password', 'amministratore', 'utente', 'accesso', 'benvenuto', 'ciao', 'computer', 'sicurezza', 'sistema', 'server', 'rete', 'internet', 'manager', 'servizio', 'accesso', 'account', 'italia', 'roma', 'milano', 'napoli', 'torino', 'palermo', 'genova', 'bologna', 'firenze', 'bari'],
-            'de': ['passwort', 'administrator', 'benutzer', 'anmeldung', 'willkommen', 'hallo', 'computer', 'sicherheit', 'system', 'server', 'netzwerk', 'internet', 'manager', 'service', 'zugang', 'konto', 'deutschland', 'berlin', 'hamburg', 'münchen', 'köln', 'frankfurt', 'stuttgart', 'düsseldorf', 'dortmund', 'essen'],
-            'ru': ['пароль', 'администратор', 'пользователь', 'вход', 'добропожаловать', 'привет', 'компьютер', 'безопасность', 'система', 'сервер', 'сеть', 'интернет', 'менеджер', 'сервис', 'доступ', 'аккаунт', 'россия', 'москва', 'петербург', 'новосибирск', 'екатеринбург', 'казань', 'челябинск', 'омск', 'самара', 'ростов']
-        }
+    def __init__(self, wordlist_dir=None, wordlists=None, walk_table=None, markov_model=None):
+        self.wordlist_dir = wordlist_dir
+        self.wordlists = wordlists if wordlists is not None else load_wordlists(wordlist_dir)
+        self.walk_table = walk_table
+        self.markov_model = markov_model
+        self.reload_lock = threading.Lock()
+        self.reload_error = None
         self.current_language = 'en'
+
+    @property
+    def dictionary_words(self):
+        """Dictionary words per language from the active word lists"""
+        return self.wordlists.dictionary_words
+
+    def reload_wordlists(self, wordlist_dir=None, background=True):
+        """Reload the word lists from disk and swap them in atomically.
+
+        The new lists and matchers are built off to the side (on a worker
+        thread unless background is False) and published with a single
+        attribute assignment. Each analysis reads the lists once, so one that
+        is already running finishes with the lists it started with.
+        wordlist_dir only changes once the new lists are in place. If the
+        files cannot be read or contain an invalid pattern, the current lists
+        and directory are kept and the error is stored in reload_error (and
+        raised when run inline). Returns the worker thread, or None when run
+        inline.
+        """
+        if wordlist_dir is None:
+            wordlist_dir = self.wordlist_dir
+        def rebuild():
+            with self.reload_lock:
+                try:
+                    wordlists = load_wordlists(wordlist_dir)
+                except (OSError, ValueError) as error:
+                    self.reload_error = error
+                    if not background:
+                        raise
+                else:
+                    self.wordlist_dir = wordlist_dir
+                    self.wordlists = wordlists
+                    self.reload_error = None
+        if not background:
+            rebuild()
+            return None
+        thread = threading.Thread(target=rebuild, daemon=True)
+        thread.start()
+        return thread
+
+    def wordlists_changed(self):
+        """Return True if the word list files on disk differ from the loaded ones"""
+        return wordlist_signature(self.wordlist_dir) != self.wordlists.signature
     
     def set_language(self, language):
         """Set the primary language for testing"""
         self.current_language = language
     
-    def detect_language(self, password):
-        """Detect the language of words in the password"""
+    def find_dictionary_words(self, password, wordlists=None):
+        """Find the first dictionary word of each language contained in the password"""
         lower_pass = password.lower()
-        detected_languages = []
-        for lang, words in self.dictionary_words.items():
-            if lang == self.current_language:
-                continue
-            for word in words:
-                if word in lower_pass:
-                    detected_languages.append(lang)
-                    break
-        return detected_languages
+        found = {}
+        for lang, matcher in (wordlists or self.wordlists).dictionary_matchers.items():
+            match = matcher.search(lower_pass) if matcher else None
+            if match:
+                found[lang] = match.group(0)
+        return found
+
+    def detect_language(self, password, language=None, found=None):
+        """Detect the language of words in the password"""
+        language = language or self.current_language
+        if found is None:
+            found = self.find_dictionary_words(password)
+        return [lang for lang in found if lang != language]
     
-    def perform_security_tests(self, password):
+    def perform_security_tests(self, password, language=None):
         """Perform all security tests on the password"""
-        tests = {
-            'length': self.test_length(password),
-            'character_variety': self.test_character_variety(password),
-            'common_patterns': self.test_common_patterns(password),
-            'dictionary_words': self.test_dictionary_words(password),
-            'repetition': self.test_repetition(password),
-            'entropy': self.calculate_entropy(password),
-            'keyboard_patterns': self.test_keyboard_patterns(password),
-            'personal_info': self.test_personal_info_patterns(password)
+        return self.localize_analysis(self.perform_language_independent_tests(password), language)
+
+    def perform_language_independent_tests(self, password):
+        """Run the tests whose results do not depend on the selected language.
+
+        The result can be passed to localize_analysis for any number of
+        languages without repeating this work. The word lists are read once,
+        so a concurrent reload_wordlists cannot mix old and new lists.
+        """
+        wordlists = self.wordlists
+        return {
+            'password': password,
+            'tests': {
+                'length': self.test_length(password),
+                'character_variety': self.test_character_variety(password),
+                'common_patterns': self.test_common_patterns(password, wordlists),
+                'repetition': self.test_repetition(password),
+                'entropy': self.calculate_entropy(password),
+                'keyboard_patterns': self.test_keyboard_patterns(password),
+                'personal_info': self.test_personal_info_patterns(password, wordlists)
+            },
+            'dictionary_matches': self.find_dictionary_words(password, wordlists)
         }
+
+    def localize_analysis(self, shared, language=None):
+        """Build the full analysis for a language from language-independent results"""
+        language = language or self.current_language
+        password = shared['password']
+        dictionary = self.test_dictionary_words(password, language, shared['dictionary_matches'])
+        tests = {name: dictionary if name == 'dictionary_words' else shared['tests'][name] for name in TEST_ORDER}
         total_score = sum(test['score'] for test in tests.values())
         return {
             'password': password,
             'total_score': min(100, total_score),
             'tests': tests,
-            'recommendations': self.generate_recommendations(tests)
+            'recommendations': self.generate_recommendations(tests, language),
+            'shared': shared
         }
+
+    def perform_multilingual_tests(self, password, languages=None):
+        """Return {language: analysis}, running the language-independent tests once"""
+        shared = self.perform_language_independent_tests(password)
+        return {lang: self.localize_analysis(shared, lang) for lang in languages or LANGUAGES}
         
     def test_length(self, password):
         """Test password length"""
@@ -90,35 +249,27 @@ class PasswordAnalyzer:
             message = 'Uses only 1 character type. Very weak.'
         return {'score': score, 'status': status, 'message': message}
         
-    def test_common_patterns(self, password):
+    def test_common_patterns(self, password, wordlists=None):
         """Test for common password patterns"""
-        common_patterns = [
-            r'123456', r'password', r'qwerty', r'abc123', r'admin',
-            r'letmein', r'welcome', r'monkey', r'dragon', r'master',
-            r'iloveyou', r'princess', r'football', r'baseball', r'sunshine',
-            r'passw0rd', r'12345678', r'superman', r'trustno1', r'starwars'
-        ]
-        for pattern in common_patterns:
-            if re.search(pattern, password.lower()):
-                return {'score': 0, 'status': 'FAIL', 'message': f'Contains common pattern: {pattern}'}   
+        matcher = (wordlists or self.wordlists).pattern_matcher
+        match = matcher.search(password.lower()) if matcher else None
+        if match:
+            return {'score': 0, 'status': 'FAIL', 'message': f'Contains common pattern: {match.group(0)}'}   
         return {'score': 15, 'status': 'PASS', 'message': 'No common patterns detected.'}
         
-    def test_dictionary_words(self, password):
+    def test_dictionary_words(self, password, language=None, found=None):
         """Test for dictionary words with multilingual support"""
-        lower_pass = password.lower()
-        primary_words = self.dictionary_words.get(self.current_language, [])
-        for word in primary_words:
-            if word in lower_pass:
-                return {'score': 0, 'status': 'FAIL', 'message': f'Contains dictionary word: {word}'}
-        detected_languages = self.detect_language(password)
+        language = language or self.current_language
+        if found is None:
+            found = self.find_dictionary_words(password)
+        if language in found:
+            return {'score': 0, 'status': 'FAIL', 'message': f'Contains dictionary word: {found[language]}'}
+        detected_languages = self.detect_language(password, language, found)
         if detected_languages:
-            for lang in detected_languages:
-                words = self.dictionary_words.get(lang, [])
-                for word in words:
-                    if word in lower_pass:
-                        lang_names = {'en': 'English', 'fr': 'French', 'es': 'Spanish', 'it': 'Italian', 'de': 'German', 'ru': 'Russian'}
-                        lang_name = lang_names.get(lang, lang)
-                        return {'score': 0, 'status': 'FAIL', 'message': f'Contains {lang_name} dictionary word: {word}'}
+            lang = detected_languages[0]
+            lang_names = {'en': 'English', 'fr': 'French', 'es': 'Spanish', 'it': 'Italian', 'de': 'German', 'ru': 'Russian'}
+            lang_name = lang_names.get(lang, lang)
+            return {'score': 0, 'status': 'FAIL', 'message': f'Contains {lang_name} dictionary word: {found[lang]}'}
         return {'score': 10, 'status': 'PASS', 'message': 'No common dictionary words found.'}
         
     def test_repetition(self, password):
@@ -135,7 +286,7 @@ class PasswordAnalyzer:
         return {'score': 10, 'status': 'PASS', 'message': 'No excessive character repetition.'}
         
     def calculate_entropy(self, password):
-        """Calculate password entropy"""
+        """Calculate password entropy, capped by the Markov guessability estimate when a model is set"""
         charset_size = 0
         if re.search(r'[a-z]', password):
             charset_size += 26
@@ -148,6 +299,8 @@ class PasswordAnalyzer:
         if charset_size == 0:
             return {'score': 0, 'status': 'FAIL', 'message': 'Cannot calculate entropy.'}
         entropy = len(password) * math.log2(charset_size)
+        if self.markov_model is not None:
+            entropy = min(entropy, self.markov_model.guess_bits(password))
         if entropy < 30:
             return {'score': 0, 'status': 'WEAK', 'message': f'Low entropy: {entropy:.1f} bits'}
         elif entropy < 50:
@@ -158,110 +311,35 @@ class PasswordAnalyzer:
             return {'score': 15, 'status': 'EXCELLENT', 'message': f'Excellent entropy: {entropy:.1f} bits'}
             
     def test_keyboard_patterns(self, password):
-        """Test for keyboard patterns"""
-        keyboard_patterns = [
-            'qwerty', 'qwertyuiop', 'asdf', 'asdfghjkl', 'zxcv', 'zxcvbnm',
-            '1234', '12345678', 'qaz', 'wsx', 'edc', 'rfv', 'tgb', 'yhn',
-            'qwe', 'asd', 'zxc', 'poi', 'lkj', 'mnb'
-        ]
-        lower_pass = password.lower()
-        for pattern in keyboard_patterns:
-            if pattern in lower_pass or pattern[::-1] in lower_pass:
-                return {'score': 0, 'status': 'FAIL', 'message': f'Contains keyboard pattern: {pattern}'}     
-        return {'score': 5, 'status': 'PASS', 'message': 'No keyboard patterns detected.'}
+        """Test for keyboard walks on QWERTY, AZERTY, QWERTZ and JCUKEN layouts"""
+        walks = find_keyboard_walks(password, table=self.walk_table)
+        if walks:
+            walk = walks[0]
+            if walk['length'] == MIN_WALK_LENGTH:
+                return {'score': 2, 'status': 'WEAK', 'walks': walks,
+                        'message': f"Contains short keyboard run: {walk['walk']}"}
+            return {'score': 0, 'status': 'FAIL', 'walks': walks,
+                    'message': f"Contains keyboard walk: {walk['walk']} ({walk['length']} keys, {walk['turns']} turns)"}
+        return {'score': 5, 'status': 'PASS', 'walks': [], 'message': 'No keyboard patterns detected.'}
 
-    def test_personal_info_patterns(self, password):
+    def test_personal_info_patterns(self, password, wordlists=None):
         """Test for personal information patterns"""
         if re.search(r'19\d{2}|20\d{2}', password):
             return {'score': 0, 'status': 'WARN', 'message': 'May contain birth year or date.'}
         if re.search(r'(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)', password.lower()):
             return {'score': 2, 'status': 'WARN', 'message': 'May contain month name.'}
-        common_names = ['john', 'mike', 'david', 'chris', 'alex', 'sarah', 'emma', 'lisa']
-        for name in common_names:
-            if name in password.lower():
-                return {'score': 1, 'status': 'WARN', 'message': f'May contain common name: {name}'}
+        name_matcher = (wordlists or self.wordlists).name_matcher
+        match = name_matcher.search(password.lower()) if name_matcher else None
+        if match:
+            return {'score': 1, 'status': 'WARN', 'message': f'May contain common name: {match.group(0)}'}
         if re.search(r'0123|1234|2345|3456|4567|5678|6789', password):
             return {'score': 0, 'status': 'FAIL', 'message': 'Contains sequential numbers.'}
         return {'score': 5, 'status': 'PASS', 'message': 'No obvious personal information detected.'}
         
-    def generate_recommendations(self, tests):
+    def generate_recommendations(self, tests, language=None):
         """Generate security recommendations based on test results"""
         recommendations = []
-        messages = {
-            'en': {
-                'length': "• Increase password length to at least 12 characters",
-                'variety': "• Use a mix of uppercase, lowercase, numbers, and symbols",
-                'patterns': "• Avoid common patterns and dictionary words",
-                'entropy': "• Increase randomness and unpredictability",
-                'keyboard': "• Avoid keyboard patterns like 'qwerty' or '123456'",
-                'repetition': "• Avoid repeating characters or patterns",
-                'personal': "• Avoid personal information like birth years or names",
-                'good1': "• Your password meets security standards",
-                'good2': "• Consider using a password manager for unique passwords",
-                'good3': "• Change passwords regularly for sensitive accounts"
-            },
-            'fr': {
-                'length': "• Augmentez la longueur du mot de passe à au moins 12 caractères",
-                'variety': "• Utilisez un mélange de majuscules, minuscules, chiffres et symboles",
-                'patterns': "• Évitez les motifs communs et les mots du dictionnaire",
-                'entropy': "• Augmentez le caractère aléatoire et l'imprévisibilité",
-                'keyboard': "• Évitez les motifs de clavier comme 'qwerty' ou '123456'",
-                'repetition': "• Évitez la répétition de caractères ou de motifs",
-                'personal': "• Évitez les informations personnelles comme les années de naissance",
-                'good1': "• Votre mot de passe respecte les normes de sécurité",
-                'good2': "• Envisagez d'utiliser un gestionnaire de mots de passe",
-                'good3': "• Changez régulièrement les mots de passe des comptes sensibles"
-            },
-            'es': {
-                'length': "• Aumente la longitud de la contraseña a al menos 12 caracteres",
-                'variety': "• Use una mezcla de mayúsculas, minúsculas, números y símbolos",
-                'patterns': "• Evite patrones comunes y palabras del diccionario",
-                'entropy': "• Aumente la aleatoriedad e impredecibilidad",
-                'keyboard': "• Evite patrones de teclado como 'qwerty' o '123456'",
-                'repetition': "• Evite repetir caracteres o patrones",
-                'personal': "• Evite información personal como años de nacimiento",
-                'good1': "• Su contraseña cumple con los estándares de seguridad",
-                'good2': "• Considere usar un administrador de contraseñas",
-                'good3': "• Cambie las contraseñas regularmente para cuentas sensibles"
-            },
-            'it': {
-                'length': "• Aumentare la lunghezza della password ad almeno 12 caratteri",
-                'variety': "• Usare un mix di maiuscole, minuscole, numeri e simboli",
-                'patterns': "• Evitare pattern comuni e parole del dizionario",
-                'entropy': "• Aumentare casualità e imprevedibilità",
-                'keyboard': "• Evitare pattern di tastiera come 'qwerty' o '123456'",
-                'repetition': "• Evitare ripetizioni di caratteri o pattern",
-                'personal': "• Evitare informazioni personali come anni di nascita",
-                'good1': "• La tua password soddisfa gli standard di sicurezza",
-                'good2': "• Considera l'uso di un gestore di password",
-                'good3': "• Cambia regolarmente le password per account sensibili"
-            },
-            'de': {
-                'length': "• Erhöhen Sie die Passwortlänge auf mindestens 12 Zeichen",
-                'variety': "• Verwenden Sie eine Mischung aus Groß-, Kleinbuchstaben, Zahlen und Symbolen",
-                'patterns': "• Vermeiden Sie häufige Muster und Wörterbuch-Wörter",
-                'entropy': "• Erhöhen Sie Zufälligkeit und Unvorhersagbarkeit",
-                'keyboard': "• Vermeiden Sie Tastaturmuster wie 'qwerty' oder '123456'",
-                'repetition': "• Vermeiden Sie wiederholende Zeichen oder Muster",
-                'personal': "• Vermeiden Sie persönliche Informationen wie Geburtsjahre",
-                'good1': "• Ihr Passwort erfüllt die Sicherheitsstandards",
-                'good2': "• Erwägen Sie die Verwendung eines Passwort-Managers",
-                'good3': "• Ändern Sie Passwörter regelmäßig für sensible Konten"
-            },
-            'ru': {
-                'length': "• Увеличьте длину пароля до минимум 12 символов",
-                'variety': "• Используйте смесь заглавных, строчных букв, цифр и символов",
-                'patterns': "• Избегайте общих шаблонов и словарных слов",
-                'entropy': "• Увеличьте случайность и непредсказуемость",
-                'keyboard': "• Избегайте клавиатурных шаблонов как 'qwerty' или '123456'",
-                'repetition': "• Избегайте повторения символов или шаблонов",
-                'personal': "• Избегайте личной информации как годы рождения",
-                'good1': "• Ваш пароль соответствует стандартам безопасности",
-                'good2': "• Рассмотрите использование менеджера паролей",
-                'good3': "• Регулярно меняйте пароли для важных аккаунтов"
-            }
-        }
-        lang_messages = messages.get(self.current_language, messages['en'])
+        lang_messages = RECOMMENDATION_MESSAGES.get(language or self.current_language, RECOMMENDATION_MESSAGES['en'])
         if tests['length']['score'] < 15:
             recommendations.append(lang_messages['length'])
         if tests['character_variety']['score'] < 20:
@@ -276,6 +354,8 @@ class PasswordAnalyzer:
             recommendations.append(lang_messages['repetition'])            
         if tests['personal_info']['score'] < 3:
             recommendations.append(lang_messages['personal'])           
+        if tests.get('password_history', {}).get('status') == 'FAIL':
+            recommendations.append(lang_messages['history'])
         if not recommendations:
             recommendations.append(lang_messages['good1'])
             recommendations.append(lang_messages['good2'])
@@ -29,7 +29,23 @@ TRANSLATIONS = {
         'weak': 'WEAK',
         'moderate': 'MODERATE',
         'strong': 'STRONG',
-        'very_strong': 'VERY STRONG'
+        'very_strong': 'VERY STRONG',
+        'bulk_audit': 'BULK AUDIT',
+        'bulk_audit_title': 'Bulk Audit',
+        'bulk_audit_desc': 'Load a file of passwords and review every result',
+        'load_file': 'LOAD FILE',
+        'cancel': 'CANCEL',
+        'line': 'Line',
+        'password': 'Password',
+        'score': 'Score',
+        'failed_tests': 'Failed Tests',
+        'min_score': 'Min score',
+        'max_score': 'Max score',
+        'all': 'All',
+        'results_count': '{shown} of {total} results',
+        'loading_file': 'Loading {name}...',
+        'cancelled': 'Cancelled',
+        'load_failed': 'Error: {error}'
     },
     'fr': {
         'title': 'ANALYSEUR DE MOT DE PASSE',
@@ -61,7 +77,23 @@ TRANSLATIONS = {
         'weak': 'FAIBLE',
         'moderate': 'MODÉRÉ',
         'strong': 'FORT',
-        'very_strong': 'TRÈS FORT'
+        'very_strong': 'TRÈS FORT',
+        'bulk_audit': 'AUDIT EN MASSE',
+        'bulk_audit_title': 'Audit en Masse',
+        'bulk_audit_desc': 'Chargez un fichier de mots de passe et examinez chaque résultat',
+        'load_file': 'CHARGER',
+        'cancel': 'ANNULER',
+        'line': 'Ligne',
+        'password': 'Mot de passe',
+        'score': 'Score',
+        'failed_tests': 'Tests Échoués',
+        'min_score': 'Score min',
+        'max_score': 'Score max',
+        'all': 'Tous',
+        'results_count': '{shown} sur {total} résultats',
+        'loading_file': 'Chargement de {name}...',
+        'cancelled': 'Annulé',
+        'load_failed': 'Erreur : {error}'
     },
     'es': {
         'title': 'ANALIZADOR DE CONTRASEÑAS',
@@ -93,7 +125,23 @@ TRANSLATIONS = {
         'weak': 'DÉBIL',
         'moderate': 'MODERADO',
         'strong': 'FUERTE',
-        'very_strong': 'MUY FUERTE'
+        'very_strong': 'MUY FUERTE',
+        'bulk_audit': 'AUDITORÍA MASIVA',
+        'bulk_audit_title': 'Auditoría Masiva',
+        'bulk_audit_desc': 'Cargue un archivo de contraseñas y revise cada resultado',
+        'load_file': 'CARGAR',
+        'cancel': 'CANCELAR',
+        'line': 'Línea',
+        'password': 'Contraseña',
+        'score': 'Puntuación',
+        'failed_tests': 'Pruebas Fallidas',
+        'min_score': 'Puntuación mín',
+        'max_score': 'Puntuación máx',
+        'all': 'Todos',
+        'results_count': '{shown} de {total} resultados',
+        'loading_file': 'Cargando {name}...',
+        'cancelled': 'Cancelado',
+        'load_failed': 'Error: {error}'
     },
     'it': {
         'title': 'ANALIZZATORE DI PASSWORD',
@@ -125,7 +173,23 @@ TRANSLATIONS = {
         'weak': 'DEBOLE',
         'moderate': 'MODERATO',
         'strong': 'FORTE',
-        'very_strong': 'MOLTO FORTE'
+        'very_strong': 'MOLTO FORTE',
+        'bulk_audit': 'AUDIT DI MASSA',
+        'bulk_audit_title': 'Audit di Massa',
+        'bulk_audit_desc': 'Carica un file di password ed esamina ogni risultato',
+        'load_file': 'CARICA',
+        'cancel': 'ANNULLA',
+        'line': 'Riga',
+        'password': 'Password',
+        'score': 'Punteggio',
+        'failed_tests': 'Test Falliti',
+        'min_score': 'Punteggio min',
+        'max_score': 'Punteggio max',
+        'all': 'Tutti',
+        'results_count': '{shown} di {total} risultati',
+        'loading_file': 'Caricamento di {name}...',
+        'cancelled': 'Annullato',
+        'load_failed': 'Errore: {error}'
     },
     'de': {
         'title': 'PASSWORT-ANALYSATOR',
@@ -157,7 +221,23 @@ TRANSLATIONS = {
         'weak': 'SCHWACH',
         'moderate': 'MÄSSIG',
         'strong': 'STARK',
-        'very_strong': 'SEHR STARK'
+        'very_strong': 'SEHR STARK',
+        'bulk_audit': 'MASSENPRÜFUNG',
+        'bulk_audit_title': 'Massenprüfung',
+        'bulk_audit_desc': 'Laden Sie eine Passwortdatei und prüfen Sie jedes Ergebnis',
+        'load_file': 'DATEI LADEN',
+        'cancel': 'ABBRECHEN',
+        'line': 'Zeile',
+        'password': 'Passwort',
+        'score': 'Punktzahl',
+        'failed_tests': 'Fehlgeschlagene Tests',
+        'min_score': 'Min. Punktzahl',
+        'max_score': 'Max. Punktzahl',
+        'all': 'Alle',
+        'results_count': '{shown} von {total} Ergebnissen',
+        'loading_file': 'Lade {name}...',
+        'cancelled': 'Abgebrochen',
+        'load_failed': 'Fehler: {error}'
     },
     'ru': {
         'title': 'АНАЛИЗАТОР ПАРОЛЕЙ',
@@ -189,7 +269,23 @@ TRANSLATIONS = {
         'weak': 'СЛАБЫЙ',
         'moderate': 'СРЕДНИЙ',
         'strong': 'СИЛЬНЫЙ',
-        'very_strong': 'ОЧЕНЬ СИЛЬНЫЙ'
+        'very_strong': 'ОЧЕНЬ СИЛЬНЫЙ',
+        'bulk_audit': 'МАССОВЫЙ АУДИТ',
+        'bulk_audit_title': 'Массовый Аудит',
+        'bulk_audit_desc': 'Загрузите файл паролей и просмотрите каждый результат',
+        'load_file': 'ЗАГРУЗИТЬ',
+        'cancel': 'ОТМЕНА',
+        'line': 'Строка',
+        'password': 'Пароль',
+        'score': 'Оценка',
+        'failed_tests': 'Непройденные Тесты',
+        'min_score': 'Мин. оценка',
+        'max_score': 'Макс. оценка',
+        'all': 'Все',
+        'results_count': '{shown} из {total} результатов',
+        'loading_file': 'Загрузка {name}...',
+        'cancelled': 'Отменено',
+        'load_failed': 'Ошибка: {error}'
     }
 }
 
@@ -0,0 +1,101 @@
+import os
+import re
+from collections import namedtuple
+
+DEFAULT_DICTIONARY_WORDS = {
+    'en': ['password', 'admin', 'user', 'login', 'welcome', 'hello', 'computer', 'security', 'system', 'server', 'network', 'internet', 'manager', 'service', 'access', 'account', 'database', 'windows', 'microsoft', 'google', 'facebook', 'twitter', 'linkedin', 'instagram', 'youtube', 'amazon', 'apple', 'samsung', 'netflix', 'spotify'],
+    'fr': ['motdepasse', 'administrateur', 'utilisateur', 'connexion', 'bienvenue', 'bonjour', 'ordinateur', 'sécurité', 'système', 'serveur', 'réseau', 'internet', 'gestionnaire', 'service', 'accès', 'compte', 'france', 'paris', 'lyon', 'marseille', 'toulouse', 'nice', 'nantes', 'bordeaux', 'lille', 'rennes'],
+    'es': ['contraseña', 'administrador', 'usuario', 'iniciosesion', 'bienvenido', 'hola', 'computadora', 'seguridad', 'sistema', 'servidor', 'red', 'internet', 'gerente', 'servicio', 'acceso', 'cuenta', 'españa', 'madrid', 'barcelona', 'valencia', 'sevilla', 'zaragoza', 'málaga', 'murcia', 'palmas', 'bilbao'],
+    'it': ['password', 'amministratore', 'utente', 'accesso', 'benvenuto', 'ciao', 'computer', 'sicurezza', 'sistema', 'server', 'rete', 'internet', 'manager', 'servizio', 'accesso', 'account', 'italia', 'roma', 'milano', 'napoli', 'torino', 'palermo', 'genova', 'bologna', 'firenze', 'bari'],
+    'de': ['passwort', 'administrator', 'benutzer', 'anmeldung', 'willkommen', 'hallo', 'computer', 'sicherheit', 'system', 'server', 'netzwerk', 'internet', 'manager', 'service', 'zugang', 'konto', 'deutschland', 'berlin', 'hamburg', 'münchen', 'köln', 'frankfurt', 'stuttgart', 'düsseldorf', 'dortmund', 'essen'],
+    'ru': ['пароль', 'администратор', 'пользователь', 'вход', 'добропожаловать', 'привет', 'компьютер', 'безопасность', 'система', 'сервер', 'сеть', 'интернет', 'менеджер', 'сервис', 'доступ', 'аккаунт', 'россия', 'москва', 'петербург', 'новосибирск', 'екатеринбург', 'казань', 'челябинск', 'омск', 'самара', 'ростов']
+}
+
+DEFAULT_COMMON_PATTERNS = [
+    '123456', 'password', 'qwerty', 'abc123', 'admin',
+    'letmein', 'welcome', 'monkey', 'dragon', 'master',
+    'iloveyou', 'princess', 'football', 'baseball', 'sunshine',
+    'passw0rd', '12345678', 'superman', 'trustno1', 'starwars'
+]
+
+DEFAULT_COMMON_NAMES = ['john', 'mike', 'david', 'chris', 'alex', 'sarah', 'emma', 'lisa']
+
+Wordlists = namedtuple('Wordlists', [
+    'dictionary_words', 'common_patterns', 'common_names',
+    'dictionary_matchers', 'pattern_matcher', 'name_matcher', 'signature'
+])
+
+def wordlist_files(directory):
+    """Return {list name: path} for the files that can override the default lists"""
+    files = {f'dictionary_{lang}': os.path.join(directory, f'dictionary_{lang}.txt') for lang in DEFAULT_DICTIONARY_WORDS}
+    files['common_patterns'] = os.path.join(directory, 'common_patterns.txt')
+    files['common_names'] = os.path.join(directory, 'common_names.txt')
+    return files
+
+def wordlist_signature(directory):
+    """Return a value that changes whenever an override file is added, removed or modified"""
+    if not directory:
+        return ()
+    signature = []
+    for name, path in sorted(wordlist_files(directory).items()):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        signature.append((name, stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+def read_wordlist(path, default, lower=True):
+    """Read one entry per line, skipping blanks and # comments.
+
+    Entries are lowercased unless lower is False, which keeps regular
+    expression escapes like \\D or \\W intact.
+    """
+    if not os.path.exists(path):
+        return tuple(default)
+    with open(path, 'r', encoding='utf-8') as f:
+        entries = (line.strip() for line in f if line.strip() and not line.lstrip().startswith('#'))
+        return tuple(entry.lower() if lower else entry for entry in entries)
+
+def words_source(words):
+    """Regex source matching any of the literal words, longest first"""
+    return '|'.join(re.escape(word) for word in sorted(set(words), key=len, reverse=True))
+
+def patterns_source(patterns):
+    """Regex source matching any of the patterns"""
+    return '|'.join(f'(?:{pattern})' for pattern in patterns)
+
+def compile_source(source):
+    """Compile a matcher source, or None if it is empty"""
+    return re.compile(source) if source else None
+
+def compile_wordlists(dictionary_words, common_patterns, common_names, signature=()):
+    """Build an immutable Wordlists with the compiled matchers for the given lists.
+
+    Raises ValueError if a common pattern is not a valid regular expression.
+    """
+    dictionary_words = {lang: tuple(words) for lang, words in dictionary_words.items()}
+    try:
+        pattern_matcher = compile_source(patterns_source(common_patterns))
+    except re.error as error:
+        raise ValueError(f'Invalid common pattern: {error}') from error
+    return Wordlists(
+        dictionary_words=dictionary_words,
+        common_patterns=tuple(common_patterns),
+        common_names=tuple(common_names),
+        dictionary_matchers={lang: compile_source(words_source(words)) for lang, words in dictionary_words.items()},
+        pattern_matcher=pattern_matcher,
+        name_matcher=compile_source(words_source(common_names)),
+        signature=signature
+    )
+
+def load_wordlists(directory=None):
+    """Load the word lists, with files in directory overriding the defaults, and compile them"""
+    if not directory:
+        return compile_wordlists(DEFAULT_DICTIONARY_WORDS, DEFAULT_COMMON_PATTERNS, DEFAULT_COMMON_NAMES)
+    signature = wordlist_signature(directory)
+    files = wordlist_files(directory)
+    dictionary_words = {lang: read_wordlist(files[f'dictionary_{lang}'], words) for lang, words in DEFAULT_DICTIONARY_WORDS.items()}
+    common_patterns = read_wordlist(files['common_patterns'], DEFAULT_COMMON_PATTERNS, lower=False)
+    common_names = read_wordlist(files['common_names'], DEFAULT_COMMON_NAMES)
+    return compile_wordlists(dictionary_words, common_patterns, common_names, signature)